@@ -15,11 +15,16 @@ This script is conservative — it only auto-updates when a `.git` directory exi
 """
 
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import http.client
+import importlib
 import os
 import sys
 import subprocess
 import json
 import shutil
+import threading
 import time
 import urllib.request
 import urllib.error
@@ -45,8 +50,26 @@ REQUIRED_MODULES = {
 # Names (top-level file/dir names) to preserve during ZIP updates
 PRESERVE_NAMES = {CONFIG_PATH.name, 'plugins'}
 
+# Marker recording that a previous run already verified all dependencies
+DEPS_MARKER = REPO_ROOT / '.webdeck_deps_ok'
+
+
+def _deps_cache_key():
+    # Key the marker on interpreter + module list so a Python upgrade or a
+    # change to REQUIRED_MODULES forces a fresh check
+    raw = f"{sys.version}|{sys.executable}|{sorted(REQUIRED_MODULES)}"
+    return hashlib.blake2b(raw.encode()).hexdigest()
+
 
 def ensure_dependencies():
+    key = _deps_cache_key()
+    try:
+        if DEPS_MARKER.read_text(encoding='utf-8').strip() == key:
+            print('[DEPS] Dependencies previously verified — skipping check')
+            return True
+    except Exception:
+        pass
+
     missing = []
     for mod, pkg in REQUIRED_MODULES.items():
         try:
@@ -56,30 +79,46 @@ def ensure_dependencies():
 
     if not missing:
         print('[DEPS] All required modules are available')
+        _write_deps_marker(key)
         return True
 
     print(f"[DEPS] Missing modules: {', '.join(m for m, _ in missing)}")
-    for mod, pkg in missing:
-        try:
-            print(f"[DEPS] Installing {pkg}...")
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', pkg])
-            time.sleep(0.2)
-        except Exception as e:
-            print(f"[DEPS] Failed to install {pkg}: {e}")
-            return False
+    missing_pkgs = [pkg for _, pkg in missing]
+    try:
+        # Single pip invocation — pip resolves and downloads everything in one process
+        print(f"[DEPS] Installing {', '.join(missing_pkgs)}...")
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install', *missing_pkgs])
+    except Exception as e:
+        print(f"[DEPS] Failed to install {', '.join(missing_pkgs)}: {e}")
+        return False
 
-    # Verify again
-    for mod, _ in missing:
+    # Verify again — import the freshly installed modules concurrently
+    def _verify(mod):
         try:
-            __import__(mod)
+            importlib.import_module(mod)
+            return None
         except Exception as e:
-            print(f"[DEPS] Still cannot import {mod}: {e}")
-            return False
+            return f"[DEPS] Still cannot import {mod}: {e}"
+
+    with ThreadPoolExecutor(max_workers=len(missing)) as ex:
+        errors = [err for err in ex.map(_verify, (mod for mod, _ in missing)) if err]
+    if errors:
+        for err in errors:
+            print(err)
+        return False
 
     print('[DEPS] Dependencies installed successfully')
+    _write_deps_marker(key)
     return True
 
 
+def _write_deps_marker(key):
+    try:
+        DEPS_MARKER.write_text(key, encoding='utf-8')
+    except Exception:
+        pass
+
+
 def create_default_config():
     if CONFIG_PATH.exists():
         print(f"[CONFIG] Config exists at {CONFIG_PATH}")
@@ -112,28 +151,33 @@ def create_default_config():
         return False
 
 
-def git_check_and_update():
+def _git_fetch_quiet():
+    """Run `git fetch` silently; used to overlap the fetch with local work."""
+    try:
+        subprocess.run(['git', 'fetch'], cwd=str(REPO_ROOT),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except Exception:
+        pass
+
+
+def git_check_and_update(fetch=True):
     git_dir = REPO_ROOT / '.git'
     if not git_dir.exists():
         print('[UPDATE] No .git directory found — skipping update check')
         return False
 
-    # Ensure git is available
     try:
-        subprocess.check_call(['git', '--version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    except Exception:
-        print('[UPDATE] git not available on PATH — skipping update check')
-        return False
+        # Fetch remote (unless the caller already fetched in the background) —
+        # if git is missing from PATH this raises and we skip
+        if fetch:
+            print('[UPDATE] Fetching remote...')
+            subprocess.check_call(['git', 'fetch'], cwd=str(REPO_ROOT))
 
-    try:
-        # Fetch remote
-        print('[UPDATE] Fetching remote...')
-        subprocess.check_call(['git', 'fetch'], cwd=str(REPO_ROOT))
-
-        # Local and remote refs
-        local = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=str(REPO_ROOT)).strip()
+        # Local and upstream refs in a single git invocation
         try:
-            upstream = subprocess.check_output(['git', 'rev-parse', '@{u}'], cwd=str(REPO_ROOT)).strip()
+            out = subprocess.check_output(['git', 'rev-parse', 'HEAD', '@{u}'],
+                                          cwd=str(REPO_ROOT), stderr=subprocess.DEVNULL).splitlines()
+            local, upstream = out[0], out[1]
         except subprocess.CalledProcessError:
             # No upstream configured
             print('[UPDATE] No upstream configured for current branch — skipping auto-update')
@@ -152,79 +196,140 @@ def git_check_and_update():
         return False
 
 
+def _github_api_connection():
+    return http.client.HTTPSConnection('api.github.com', timeout=10)
+
+
+def _github_api_get(conn, path, extra_headers=None):
+    """GET a GitHub API path over a keep-alive connection.
+
+    Returns (parsed_json, etag). Raises urllib.error.HTTPError on 304 or
+    error statuses so callers keep a single handling path. A connection
+    must not be shared between threads, but sequential requests on the
+    same one reuse the TCP+TLS session.
+    """
+    headers = {'User-Agent': 'WebDeck-Updater', 'Connection': 'keep-alive'}
+    if extra_headers:
+        headers.update(extra_headers)
+    conn.request('GET', path, headers=headers)
+    resp = conn.getresponse()
+    body = resp.read()  # always drain so the connection stays reusable
+    if resp.status == 304 or resp.status >= 400:
+        raise urllib.error.HTTPError(f'https://api.github.com{path}',
+                                     resp.status, resp.reason, resp.headers, None)
+    return json.loads(body), resp.getheader('ETag')
+
+
+def _load_update_state():
+    """Read the persisted update-check state (sha/etag/default_branch)."""
+    sha_file = REPO_ROOT / '.webdeck_remote_sha'
+    try:
+        raw = sha_file.read_text(encoding='utf-8').strip()
+    except Exception:
+        return {}
+    try:
+        state = json.loads(raw)
+        if isinstance(state, dict):
+            return state
+    except json.JSONDecodeError:
+        # Legacy format: file contained only the bare SHA
+        if raw:
+            return {'sha': raw}
+    return {}
+
+
+def _save_update_state(state):
+    try:
+        (REPO_ROOT / '.webdeck_remote_sha').write_text(json.dumps(state), encoding='utf-8')
+    except Exception:
+        pass
+
+
 def github_zip_update(repo_owner='Windswipe', repo_name='WebDeck'):
     """If this installation is not a git clone, check GitHub for changes and
     download/apply a ZIP update when the remote HEAD differs from the last
     applied SHA. Preserves `webdeckCfg.json` and creates backups.
+
+    Uses GitHub conditional requests (ETag / If-None-Match) so the
+    steady-state no-change check transfers no body bytes and does not
+    count against the API rate limit.
     """
-    api_repo = f'https://api.github.com/repos/{repo_owner}/{repo_name}'
+    api_base = f'/repos/{repo_owner}/{repo_name}'
+    state = _load_update_state()
+
+    # The repo-info call only exists to learn the default branch — skip it
+    # entirely once we have it cached. Commit lookups are conditional on the
+    # cached ETag.
+    default_branch = state.get('default_branch')
+    commit_headers = {}
+    if state.get('etag'):
+        commit_headers['If-None-Match'] = state['etag']
+
+    conn = _github_api_connection()
+    commit_conn = None
     try:
-        req = urllib.request.Request(api_repo, headers={'User-Agent': 'WebDeck-Updater'})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            repo_info = json.load(resp)
-            default_branch = repo_info.get('default_branch', 'main')
-    except Exception as e:
-        print(f"[UPDATE] Could not query GitHub repo info: {e}")
+        if default_branch:
+            commit_info, etag = _github_api_get(conn, f'{api_base}/commits/{default_branch}', commit_headers)
+        else:
+            # First run: guess the default branch and fetch the repo info and
+            # the guessed commit concurrently — one round-trip instead of two
+            # when the guess is right (which it almost always is). Each thread
+            # needs its own connection; a wrong-guess re-fetch reuses the
+            # repo-info connection without another TLS handshake.
+            commit_conn = _github_api_connection()
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                repo_future = ex.submit(_github_api_get, conn, api_base)
+                commit_future = ex.submit(_github_api_get, commit_conn, f'{api_base}/commits/main', commit_headers)
+                repo_info, _ = repo_future.result()
+                default_branch = repo_info.get('default_branch', 'main')
+                state['default_branch'] = default_branch
+                if default_branch == 'main':
+                    commit_info, etag = commit_future.result()
+                else:
+                    commit_future.cancel()
+                    commit_info, etag = _github_api_get(conn, f'{api_base}/commits/{default_branch}', commit_headers)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            print('[UPDATE] Remote unchanged (304 Not Modified)')
+            _save_update_state(state)
+            return False
+        print(f"[UPDATE] Could not query GitHub: {e}")
         return False
-
-    # Get latest commit SHA for default branch
-    commit_api = f'{api_repo}/commits/{default_branch}'
-    try:
-        req = urllib.request.Request(commit_api, headers={'User-Agent': 'WebDeck-Updater'})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            commit_info = json.load(resp)
-            latest_sha = commit_info.get('sha')
     except Exception as e:
-        print(f"[UPDATE] Could not query latest commit: {e}")
+        print(f"[UPDATE] Could not query GitHub: {e}")
         return False
+    finally:
+        conn.close()
+        if commit_conn is not None:
+            commit_conn.close()
+
+    latest_sha = commit_info.get('sha')
+
+    if etag:
+        state['etag'] = etag
 
     if not latest_sha:
         print('[UPDATE] No commit SHA found from GitHub')
         return False
 
-    sha_file = REPO_ROOT / '.webdeck_remote_sha'
-    try:
-        if sha_file.exists():
-            local_sha = sha_file.read_text(encoding='utf-8').strip()
-        else:
-            local_sha = None
-    except Exception:
-        local_sha = None
-
-    if local_sha == latest_sha:
+    if state.get('sha') == latest_sha:
         print('[UPDATE] Remote ZIP up-to-date')
+        _save_update_state(state)
         return False
 
-    # Download zipball
+    # Download zipball — stream straight to disk in 1 MiB chunks so the
+    # multi-MB archive is never held in memory
     zip_url = f'https://github.com/{repo_owner}/{repo_name}/archive/refs/heads/{default_branch}.zip'
     print(f"[UPDATE] Downloading {zip_url}...")
+    tmpdir = Path(tempfile.mkdtemp(prefix='webdeck_update_'))
+    zip_path = tmpdir / 'update.zip'
     try:
-        with urllib.request.urlopen(urllib.request.Request(zip_url, headers={'User-Agent': 'WebDeck-Updater'}), timeout=30) as resp:
-            data = resp.read()
+        req = urllib.request.Request(zip_url, headers={'User-Agent': 'WebDeck-Updater'})
+        with urllib.request.urlopen(req, timeout=30) as resp, open(zip_path, 'wb') as fh:
+            shutil.copyfileobj(resp, fh, 1024 * 1024)
     except Exception as e:
         print(f"[UPDATE] Failed to download ZIP: {e}")
-        return False
-
-    # Extract to temp dir
-    try:
-        tmpdir = Path(tempfile.mkdtemp(prefix='webdeck_update_'))
-        zip_path = tmpdir / 'update.zip'
-        zip_path.write_bytes(data)
-        with zipfile.ZipFile(str(zip_path), 'r') as z:
-            z.extractall(str(tmpdir))
-        # Find extracted root dir
-        children = [p for p in tmpdir.iterdir() if p.is_dir()]
-        if not children:
-            print('[UPDATE] Extracted ZIP contains no files')
-            shutil.rmtree(str(tmpdir), ignore_errors=True)
-            return False
-        extracted_root = children[0]
-    except Exception as e:
-        print(f"[UPDATE] Failed to extract ZIP: {e}")
-        try:
-            shutil.rmtree(str(tmpdir), ignore_errors=True)
-        except Exception:
-            pass
+        shutil.rmtree(str(tmpdir), ignore_errors=True)
         return False
 
     # Prepare backup dir
@@ -232,47 +337,62 @@ def github_zip_update(repo_owner='Windswipe', repo_name='WebDeck'):
     backup_root = REPO_ROOT / 'backups' / timestamp
     backup_root.mkdir(parents=True, exist_ok=True)
 
-    # Copy files from extracted_root into REPO_ROOT, backing up overwritten files
+    # Apply the update straight from the archive into REPO_ROOT. Extracting
+    # members directly (instead of extract-to-tempdir then copy) writes every
+    # byte to disk exactly once, and backing up overwritten files is a pure
+    # rename — no data copied.
     preserved_names = PRESERVE_NAMES
+    repo_root_str = str(REPO_ROOT)
+    backup_root_str = str(backup_root)
     try:
-        for src in extracted_root.rglob('*'):
-            rel = src.relative_to(extracted_root)
-            # Skip .git artifacts
-            if '.git' in rel.parts:
-                continue
-
-            # If the top-level path is in preserved_names, skip applying changes
-            top = rel.parts[0] if len(rel.parts) > 0 else None
-            if top in preserved_names:
-                # If it's a directory preserve, log and skip
-                dest = REPO_ROOT / rel
-                if dest.exists():
-                    print(f"[UPDATE] Preserving user file/dir: {dest}")
-                continue
-
-            dest = REPO_ROOT / rel
-            if src.is_dir():
-                dest.mkdir(parents=True, exist_ok=True)
-                continue
-
-            # Backup dest if exists
-            if dest.exists():
-                dest_parent = backup_root / rel.parent
-                dest_parent.mkdir(parents=True, exist_ok=True)
-                try:
-                    shutil.copy2(str(dest), str(dest_parent / dest.name))
-                except Exception:
-                    pass
-
-            # Ensure parent exists and copy
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(str(src), str(dest))
-
-        # Write latest sha
-        try:
-            sha_file.write_text(latest_sha, encoding='utf-8')
-        except Exception:
-            pass
+        with zipfile.ZipFile(str(zip_path), 'r', allowZip64=True) as z:
+            for info in z.infolist():
+                # Strip the leading 'WebDeck-<sha>/' directory GitHub adds
+                parts = [p for p in info.filename.split('/') if p]
+                if len(parts) < 2:
+                    continue
+                rel_parts = parts[1:]
+
+                # Skip .git artifacts
+                if '.git' in rel_parts:
+                    continue
+
+                rel = os.sep.join(rel_parts)
+                dest = os.path.join(repo_root_str, rel)
+
+                # If the top-level path is in preserved_names, skip applying changes
+                if rel_parts[0] in preserved_names:
+                    # If it's a file/dir preserve, log and skip
+                    if os.path.exists(dest):
+                        print(f"[UPDATE] Preserving user file/dir: {dest}")
+                    continue
+
+                if info.is_dir():
+                    os.makedirs(dest, exist_ok=True)
+                    continue
+
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                if os.path.exists(dest):
+                    # Backup is a pure rename — zero bytes copied. Fall back
+                    # to a real copy only if the backup dir is cross-device.
+                    backup_parent = os.path.join(backup_root_str, os.path.dirname(rel))
+                    os.makedirs(backup_parent, exist_ok=True)
+                    backup_dest = os.path.join(backup_parent, rel_parts[-1])
+                    try:
+                        os.replace(dest, backup_dest)
+                    except OSError:
+                        try:
+                            shutil.copy2(dest, backup_dest)
+                        except Exception:
+                            pass
+
+                # Rewrite the member name so extract() lands at dest
+                info.filename = '/'.join(rel_parts)
+                z.extract(info, repo_root_str)
+
+        # Persist the applied sha alongside the ETag/branch cache
+        state['sha'] = latest_sha
+        _save_update_state(state)
 
         print(f'[UPDATE] Applied ZIP update from GitHub to {REPO_ROOT} (backup at {backup_root})')
         # Clean up tmp
@@ -308,13 +428,17 @@ def ensure_startup_entry():
         python_exe = sys.executable
         webdeck_path = str(WEBDECK_SCRIPT)
 
-        content = f'start "" "{python_exe}" "{webdeck_path}"\r\n'
+        # Key the entry on the interpreter + script path and stamp it into the
+        # first line; matching the key means the rest of the file is current,
+        # so the common path reads one line instead of the whole file
+        key = hashlib.blake2b(f"{python_exe}|{webdeck_path}".encode()).hexdigest()[:16]
+        content = f'REM {key}\r\nstart "" "{python_exe}" "{webdeck_path}"\r\n'
 
         if bat_path.exists():
-            # Check content; if it already points to the same python and script, do nothing
             try:
-                existing = bat_path.read_text(encoding='utf-8')
-                if python_exe in existing and webdeck_path in existing:
+                with open(bat_path, 'rb') as f:
+                    first_line = f.readline()
+                if key.encode() in first_line:
                     print(f'[STARTUP] Startup entry already exists at {bat_path}')
                     return True
             except Exception:
@@ -355,14 +479,24 @@ def launch_server_detached():
 def main():
     print('=== WebDeck Launcher ===')
 
+    # Kick the network-bound git fetch off immediately so it overlaps the
+    # local dependency/config/startup work below
+    fetch_thread = None
+    if (REPO_ROOT / '.git').exists():
+        fetch_thread = threading.Thread(target=_git_fetch_quiet, daemon=True)
+        fetch_thread.start()
+
     ok = ensure_dependencies()
     if not ok:
         print('[MAIN] Dependency installation failed; you may need to run this script as an administrator or install packages manually.')
 
     create_default_config()
+    ensure_startup_entry()
 
     try:
-        updated = git_check_and_update()
+        if fetch_thread is not None:
+            fetch_thread.join()
+        updated = git_check_and_update(fetch=False)
         if not updated:
             # attempt non-git update flow
             try:
@@ -377,8 +511,6 @@ def main():
     except Exception:
         pass
 
-    ensure_startup_entry()
-
     launched = launch_server_detached()
     if launched:
         print('[MAIN] Exiting launcher.')
@@ -6,12 +6,17 @@ from windows_toasts import Toast, ToastDuration, ToastScenario, WindowsToaster
 
 notifHost = WindowsToaster("Stream Deck")
 
+# Preallocated toast templates — reuse them and swap text_fields per event
+# instead of paying the WinRT Toast constructor on every notification
+_TOAST_EVENT = Toast()
+_TOAST_EVENT.duration = ToastDuration.Short
+_TOAST_ERROR = Toast()
+_TOAST_ERROR.duration = ToastDuration.Short
+_TOAST_ERROR.scenario = ToastScenario.Important
+
 def throw_error(message):
-    notif = Toast()
-    notif.duration = ToastDuration.Short
-    notif.scenario = ToastScenario.Important
-    notif.text_fields = ["An error was encountered.", message]
-    notifHost.show_toast(notif)
+    _TOAST_ERROR.text_fields = ["An error was encountered.", message]
+    notifHost.show_toast(_TOAST_ERROR)
 
 def get_foreground_process_name():
     try:
@@ -26,36 +31,56 @@ def get_foreground_process_name():
         throw_error(f"Could not get foreground process ID or name. {Exception}")
         return None
 
+# Processes whose audio should never be toggled (lower-cased once so the
+# per-press check is a single O(1) hash lookup)
+_IGNORED = frozenset({
+    "windowsterminal.exe",
+    "cmd.exe",
+    "powershell.exe",
+    "streamdeck.exe",
+    "python.exe"
+})
+
+# Cache of process name -> (pid, SimpleAudioVolume). The COM session
+# enumeration dominates the toggle cost, so reuse the volume handle while
+# the process is still alive.
+_vol_cache = {}
+
+def get_volume_for_process(target):
+    cached = _vol_cache.get(target)
+    if cached:
+        pid, volume = cached
+        if psutil.pid_exists(pid):
+            return volume
+        del _vol_cache[target]
+
+    for session in AudioUtilities.GetAllSessions():
+        if session.Process and session.Process.name() == target:
+            volume = session.SimpleAudioVolume
+            _vol_cache[target] = (session.Process.pid, volume)
+            return volume
+    return None
+
 def main():
     target = get_foreground_process_name()
 
-    ignored_processes = [
-        "WindowsTerminal.exe", 
-        "cmd.exe", 
-        "powershell.exe", 
-        "StreamDeck.exe", 
-        "python.exe"
-    ]
-
-    if not target or target in ignored_processes:
+    if not target or target.lower() in _IGNORED:
         print(f"Ignored or invalid process: {target}")
         return
 
-    sessions = AudioUtilities.GetAllSessions()
-    for session in sessions:
-        if session.Process and session.Process.name() == target:
-            volume = session.SimpleAudioVolume
-            current_mute = volume.GetMute()
-            volume.SetMute(1 - current_mute, None)
-            print(f"Toggled mute for {target}")
-            notif = Toast()
-            notif.duration = ToastDuration.Short
-            #notif.scenario = ToastScenario.Important
-            if current_mute:
-                notif.text_fields = [f"Button Event", f"Unmuted {target}"]
-            else:
-                notif.text_fields = [f"Button Event", f"Muted {target}"]
-            notifHost.show_toast(notif)
+    volume = get_volume_for_process(target)
+    if volume is None:
+        print(f"No audio session found for {target}")
+        return
+
+    current_mute = volume.GetMute()
+    volume.SetMute(1 - current_mute, None)
+    print(f"Toggled mute for {target}")
+    if current_mute:
+        _TOAST_EVENT.text_fields = [f"Button Event", f"Unmuted {target}"]
+    else:
+        _TOAST_EVENT.text_fields = [f"Button Event", f"Muted {target}"]
+    notifHost.show_toast(_TOAST_EVENT)
 
 class WebDeckPlugin:
     metadata = {
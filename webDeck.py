@@ -3,13 +3,17 @@ A simple web server that runs Stream Deck-like actions based on HTTP POST reques
 Supports automatic discovery and connection handling.
 '''
 
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import functools
+import hashlib
 import json
-from tkinter import messagebox
 import socket
 import logging
 import os
+import queue
 import threading
+import time
 import sys
 import subprocess
 import importlib.util
@@ -18,45 +22,196 @@ import traceback
 import re
 from pathlib import Path
 
-try:
-    from pynput.keyboard import Controller, Key
-    MEDIA_CONTROL_AVAILABLE = True
-except ImportError:
-    MEDIA_CONTROL_AVAILABLE = False
-    print("pynput not found. Media control will be disabled.")
-
 try:
     from windows_toasts import Toast, ToastDuration, ToastScenario, WindowsToaster
 except ImportError:
     WindowsToaster = None
 
 try:
-    from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
-    from PyQt6.QtGui import QIcon
-    PYQT_AVAILABLE = True
+    # orjson (Rust extension) parses and serializes several times faster than
+    # stdlib json and emits bytes directly — used on the request hot paths.
+    # The config-file writer stays on stdlib json for its indent=4 output.
+    import orjson
+    _jloads = orjson.loads
+    _jdumps = orjson.dumps
 except ImportError:
-    PYQT_AVAILABLE = False
-    print("PyQt6 not found. Tray applet will be disabled.")
-
-# Initialize the keyboard controller
-keyboard_controller = Controller() if MEDIA_CONTROL_AVAILABLE else None
+    _jloads = json.loads
+    def _jdumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# pynput and PyQt6 are imported lazily on first use — together they cost
+# tens to hundreds of ms of startup time even when never exercised
+# (e.g. a headless run, or a client that never presses a media key).
+keyboard_controller = None
+_media_keys = {}  # action -> pynput Key, filled by _ensure_media_control
+_media_unavailable = False
+
+_MEDIA_MSGS = {
+    "pause_media": "Toggled play/pause.",
+    "toggle_mute": "Toggled mute.",
+    "skip_track": "Skipped to next track.",
+    "previous_track": "Skipped to previous track.",
+}
+
+# Success responses are immutable in practice, so build them once and reuse
+# them on every press instead of allocating a fresh dict per request.
+_CACHED_OK = {
+    action: {"status": "success", "message": msg}
+    for action, msg in _MEDIA_MSGS.items()
+}
+
+# action -> monotonic ns of the last successful press. Double-taps from a
+# phone GUI arrive within a few tens of ms; anything inside this window is
+# treated as a duplicate and answered without touching the keyboard.
+_LAST_MEDIA = {}
+_MEDIA_DEBOUNCE_NS = 75_000_000
+
+
+def _ensure_media_control():
+    """Import pynput and create the keyboard controller on first use."""
+    global keyboard_controller, _media_unavailable
+    if keyboard_controller is not None:
+        return True
+    if _media_unavailable:
+        return False
+    try:
+        from pynput.keyboard import Controller, Key
+    except ImportError:
+        _media_unavailable = True
+        print("pynput not found. Media control will be disabled.")
+        return False
+    keyboard_controller = Controller()
+    _media_keys.update({
+        "pause_media": Key.media_play_pause,
+        "toggle_mute": Key.media_volume_mute,
+        "skip_track": Key.media_next,
+        "previous_track": Key.media_previous,
+    })
+    return True
 
 # Suppress HTTP server logging
 logging.getLogger().setLevel(logging.CRITICAL)
 
+# Direct Win32 handle for lock_screen. os.system spawned cmd.exe plus
+# rundll32 (two processes and ~100 ms) for an API call that already lives
+# in this process's user32.dll.
+_user32 = None
+if os.name == 'nt':
+    try:
+        import ctypes
+        _user32 = ctypes.windll.user32
+        _user32.LockWorkStation.restype = ctypes.c_bool
+    except Exception:
+        _user32 = None
+
+# Server port and host identity — resolved once at import. On Windows
+# gethostbyname can synchronously hit DNS/NetBIOS with multi-hundred-ms
+# latency, so keep it off the request path.
+PORT = 8001
+HOSTNAME = socket.gethostname()
+try:
+    IP_ADDR = socket.gethostbyname(HOSTNAME)
+except OSError:
+    IP_ADDR = '0.0.0.0'
+
+_IP_REFRESH_SECONDS = 300
+
+
+def _refresh_ip():
+    """Re-resolve the cached IP, then rearm. Runs off the request path so a
+    stalled DNS lookup after a network change never blocks a client."""
+    global IP_ADDR
+    try:
+        IP_ADDR = socket.gethostbyname(HOSTNAME)
+    except OSError:
+        pass  # keep the last known address
+    timer = threading.Timer(_IP_REFRESH_SECONDS, _refresh_ip)
+    timer.daemon = True
+    timer.start()
+
+# Pre-serialized payloads for the polling endpoints (static for the
+# lifetime of the process — the hostname doesn't change mid-session)
+DISCOVER_BODY = json.dumps({
+    "status": "online",
+    "message": "WebDeck server is online",
+    "hostname": HOSTNAME,
+    "port": PORT
+}).encode('utf-8')
+STATUS_BODY = json.dumps({
+    "status": "online",
+    "hostname": HOSTNAME,
+    "port": PORT
+}).encode('utf-8')
+
+
+def _etag_for(body):
+    """Strong ETag for a response body (quoted, per RFC 9110)."""
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+DISCOVER_ETAG = _etag_for(DISCOVER_BODY)
+
 notifHost = WindowsToaster("WebDeck") if WindowsToaster else None
 
 # Global registry for plugin action -> callable
 PLUGIN_ACTIONS = {}
+_plugin_registry_lock = threading.Lock()
 
 
+# Compiled once — _camel_to_snake runs for every registered plugin method
+_CAMEL_RE1 = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_RE2 = re.compile('([a-z0-9])([A-Z])')
+
+
+@functools.lru_cache(maxsize=256)
 def _camel_to_snake(name: str) -> str:
     # Convert CamelCase or mixedCase to snake_case
-    s1 = re.sub('(.)([A-Z][a-z]+)', r"\1_\2", name)
-    s2 = re.sub('([a-z0-9])([A-Z])', r"\1_\2", s1)
+    s2 = _CAMEL_RE2.sub(r"\1_\2", _CAMEL_RE1.sub(r"\1_\2", name))
     return s2.replace('-', '_').lower()
 
 
+def _load_one_plugin(file_name, file_path):
+    """Import one plugin module and return its {action: (callable, nparams)} map."""
+    actions = {}
+    mod_name = file_name[:-3]
+    try:
+        spec = importlib.util.spec_from_file_location(f"webdeck_plugin_{mod_name}", file_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        # Only register methods on a WebDeckPlugin class (ignore module-level functions)
+        if hasattr(module, 'WebDeckPlugin'):
+            try:
+                cls = getattr(module, 'WebDeckPlugin')
+                plugin_instance = cls()
+                # vars(cls) sees only what the plugin author wrote —
+                # no dir() walk over inherited object dunders like
+                # inspect.getmembers would do
+                for attr_name, raw in vars(cls).items():
+                    # Skip private methods and metadata attribute
+                    if attr_name.startswith('_') or attr_name == 'metadata':
+                        continue
+                    if not callable(raw) or isinstance(raw, (staticmethod, classmethod)):
+                        continue
+                    attr = getattr(plugin_instance, attr_name)
+                    # Registry keys are always lower-case so dispatch
+                    # can normalize the client's action string once
+                    action_name = _camel_to_snake(attr_name).lower()
+                    # Resolve the signature once here so dispatch never
+                    # pays for inspect.signature on a request
+                    nparams = len(inspect.signature(attr).parameters)
+                    actions[action_name] = (attr, nparams)
+                    print(f"[PLUGINS] Registered action '{action_name}' -> {file_name}.WebDeckPlugin.{attr_name}()")
+            except Exception:
+                print(f"[PLUGINS] Failed to instantiate WebDeckPlugin in {file_name}:\n{traceback.format_exc()}")
+        else:
+            # No WebDeckPlugin class found — ignore this module for actions
+            print(f"[PLUGINS] Skipping {file_name}: no WebDeckPlugin class found")
+
+    except Exception:
+        print(f"[PLUGINS] Failed to load plugin {file_name}:\n{traceback.format_exc()}")
+    return actions
+
+
 def load_plugins(plugins_dir: str = None):
     """Load .py plugin modules from plugins_dir and register callable actions.
 
@@ -76,34 +231,23 @@ def load_plugins(plugins_dir: str = None):
         print(f"[PLUGINS] No plugins directory found at {plugins_path}")
         return
 
-    for p in plugins_path.iterdir():
-        if p.suffix != '.py' or p.name.startswith('_'):
-            continue
-        mod_name = p.stem
-        try:
-            spec = importlib.util.spec_from_file_location(f"webdeck_plugin_{mod_name}", str(p))
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            # Only register methods on a WebDeckPlugin class (ignore module-level functions)
-            if hasattr(module, 'WebDeckPlugin'):
-                try:
-                    cls = getattr(module, 'WebDeckPlugin')
-                    plugin_instance = cls()
-                    for attr_name, attr in inspect.getmembers(plugin_instance, inspect.ismethod):
-                        # Skip private methods and metadata attribute
-                        if attr_name.startswith('_') or attr_name == 'metadata':
-                            continue
-                        action_name = _camel_to_snake(attr_name)
-                        PLUGIN_ACTIONS.setdefault(action_name, attr)
-                        print(f"[PLUGINS] Registered action '{action_name}' -> {p.name}.WebDeckPlugin.{attr_name}()")
-                except Exception:
-                    print(f"[PLUGINS] Failed to instantiate WebDeckPlugin in {p.name}:\n{traceback.format_exc()}")
-            else:
-                # No WebDeckPlugin class found — ignore this module for actions
-                print(f"[PLUGINS] Skipping {p.name}: no WebDeckPlugin class found")
-
-        except Exception:
-            print(f"[PLUGINS] Failed to load plugin {p.name}:\n{traceback.format_exc()}")
+    # os.scandir yields DirEntry objects whose names/types come straight from
+    # readdir — no per-entry Path allocation or extra stat calls
+    with os.scandir(plugins_path) as it:
+        entries = [(entry.name, entry.path) for entry in it
+                   if entry.name.endswith('.py') and not entry.name.startswith('_')]
+
+    if entries:
+        # Plugins import independently, so fan the loads out across threads.
+        # exec_module itself serializes on the interpreter's import lock, but
+        # the file reads and each plugin's own heavy imports still overlap.
+        with ThreadPoolExecutor(max_workers=min(8, len(entries))) as ex:
+            futures = [ex.submit(_load_one_plugin, name, path) for name, path in entries]
+            results = [f.result() for f in futures]
+        with _plugin_registry_lock:
+            for actions in results:
+                for action_name, plugin_entry in actions.items():
+                    PLUGIN_ACTIONS.setdefault(action_name, plugin_entry)
 
     # Summary
     if PLUGIN_ACTIONS:
@@ -115,55 +259,84 @@ def load_plugins(plugins_dir: str = None):
 # Attempt to load plugins on import
 load_plugins()
 
+# In-memory button configuration cache keyed on the config file's mtime.
+# 'encoded' holds the pre-serialized JSON bytes served by /buttons and
+# 'etag' the matching validator for If-None-Match revalidation.
+_BUTTON_CACHE = {'mtime': None, 'buttons': None, 'encoded': None, 'etag': None}
+_button_cache_lock = threading.Lock()
+
+# First-run defaults. Kept at module scope so the hot path (config exists)
+# never allocates them, and pre-serialized so first-run setup is a single
+# file write with no json.dump call.
+_DEFAULT_BUTTONS = [
+    {"label": "Example action", "icon": "🎬", "action": "example"},
+    {"label": "Open Notepad", "icon": "🎵", "action": "open_app", "path": "C:\\Windows\\System32\\notepad.exe"},
+    {"label": "Mute/Unmute Sound", "icon": "🎙️", "action": "toggle_mute"},
+    {"label": "Play/Pause Media", "icon": "📹", "action": "pause_media"},
+    {"label": "Next/Skip Track", "icon": "🔴", "action": "skip_track"},
+    {"label": "Previous Track", "icon": "⏹️", "action": "previous_track"},
+    {"label": "Open ChatGPT", "icon": "▶️", "action": "open_url", "path": "https://chat.openai.com/"},
+    {"label": "Lock Screen", "icon": "⏸️", "action": "lock_screen"},
+    {"label": "Button 9", "icon": "🔊", "action": "action_9"},
+    {"label": "Button 10", "icon": "🔇", "action": "action_10"},
+    {"label": "Button 11", "icon": "⬆️", "action": "action_11"},
+    {"label": "Button 12", "icon": "⬇️", "action": "action_12"},
+    {"label": "Button 13", "icon": "▶️", "action": "action_7"},
+    {"label": "Button 14", "icon": "⏸️", "action": "action_8"},
+    {"label": "Button 15", "icon": "🔊", "action": "action_9"},
+    {"label": "Button 16", "icon": "🔇", "action": "action_10"},
+    {"label": "Button 17", "icon": "⬆️", "action": "action_11"},
+    {"label": "Button 18", "icon": "⬇️", "action": "action_12"}
+]
+_DEFAULT_CONFIG_BYTES = json.dumps({
+    "notifications": {
+        "enabled": True,
+        "important_only": False
+    },
+    "password": {
+        "required": False,
+        "value": "your_password_here"
+    },
+    "buttons": _DEFAULT_BUTTONS
+}, indent=4, ensure_ascii=False).encode('utf-8')
+
+
 def get_button_configuration():
-    """Load button configuration from the config file"""
+    """Load button configuration from the config file.
+
+    The parsed list (plus its pre-encoded bytes for /buttons) is cached
+    against the file's mtime, so repeated GETs skip the disk read and the
+    JSON round-trip until webdeckCfg.json actually changes.
+    """
     config_path = os.path.join(os.path.dirname(__file__), 'webdeckCfg.json')
-    
-    # Default button configuration
-    default_buttons = [
-        {"label": "Example action", "icon": "🎬", "action": "example"},
-        {"label": "Open Notepad", "icon": "🎵", "action": "open_app", "path": "C:\\Windows\\System32\\notepad.exe"},
-        {"label": "Mute/Unmute Sound", "icon": "🎙️", "action": "toggle_mute"},
-        {"label": "Play/Pause Media", "icon": "📹", "action": "pause_media"},
-        {"label": "Next/Skip Track", "icon": "🔴", "action": "skip_track"},
-        {"label": "Previous Track", "icon": "⏹️", "action": "previous_track"},
-        {"label": "Open ChatGPT", "icon": "▶️", "action": "open_url", "path": "https://chat.openai.com/"},
-        {"label": "Lock Screen", "icon": "⏸️", "action": "lock_screen"},
-        {"label": "Button 9", "icon": "🔊", "action": "action_9"},
-        {"label": "Button 10", "icon": "🔇", "action": "action_10"},
-        {"label": "Button 11", "icon": "⬆️", "action": "action_11"},
-        {"label": "Button 12", "icon": "⬇️", "action": "action_12"},
-        {"label": "Button 13", "icon": "▶️", "action": "action_7"},
-        {"label": "Button 14", "icon": "⏸️", "action": "action_8"},
-        {"label": "Button 15", "icon": "🔊", "action": "action_9"},
-        {"label": "Button 16", "icon": "🔇", "action": "action_10"},
-        {"label": "Button 17", "icon": "⬆️", "action": "action_11"},
-        {"label": "Button 18", "icon": "⬇️", "action": "action_12"}
-    ]
-    
+
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+        with _button_cache_lock:
+            if _BUTTON_CACHE['mtime'] == mtime:
+                return _BUTTON_CACHE['buttons']
+    except FileNotFoundError:
+        mtime = None
+
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
             config = json.load(f)
             if 'buttons' in config:
-                return config['buttons']
+                buttons = config['buttons']
+                encoded = _jdumps(buttons)
+                with _button_cache_lock:
+                    _BUTTON_CACHE['mtime'] = mtime
+                    _BUTTON_CACHE['buttons'] = buttons
+                    _BUTTON_CACHE['encoded'] = encoded
+                    _BUTTON_CACHE['etag'] = _etag_for(encoded)
+                return buttons
             else:
                 raise KeyError("'buttons' key not found in config file")
     except FileNotFoundError:
-        # Create config file with defaults
-        default_config = {
-            "notifications": {
-                "enabled": True,
-                "important_only": False
-            },
-            "password": {
-                "required": False,
-                "value": "your_password_here"
-            },
-            "buttons": default_buttons
-        }
+        # Create config file with defaults (already serialized at import)
         try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(default_config, f, indent=4, ensure_ascii=False)
+            with open(config_path, 'wb') as f:
+                f.write(_DEFAULT_CONFIG_BYTES)
             print(f"[CONFIG] Created default config file at {config_path}")
         except Exception as e:
             print(f"[ERROR] Failed to create config file: {e}")
@@ -171,218 +344,385 @@ def get_button_configuration():
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(f"Invalid JSON in config file: {e}", e.doc, e.pos)
 
+# Preallocated toast templates — Toast construction goes through WinRT COM,
+# so build one normal and one important template once and only swap
+# text_fields per event. Only the notification worker touches them.
+if notifHost:
+    _TOAST_NORMAL = Toast()
+    _TOAST_NORMAL.duration = ToastDuration.Short
+    _TOAST_IMPORTANT = Toast()
+    _TOAST_IMPORTANT.duration = ToastDuration.Short
+    _TOAST_IMPORTANT.scenario = ToastScenario.Important
+
+# Toasts are shown from a single background worker so request handlers never
+# block on the Windows notification IPC; identical toasts arriving within
+# 500 ms (e.g. rapid skip_track presses) are coalesced into one. The queue
+# is bounded — under a flood, the oldest pending toast is dropped rather
+# than ever blocking a request thread.
+_notif_q = queue.Queue(maxsize=64)
+
+def _notif_worker():
+    last_key = None
+    last_ts = 0.0
+    while True:
+        title, message, important, ts = _notif_q.get()
+        if (title, message) == last_key and ts - last_ts < 0.5:
+            continue
+        last_key = (title, message)
+        last_ts = ts
+        try:
+            notif = _TOAST_IMPORTANT if important else _TOAST_NORMAL
+            notif.text_fields = [title, message]
+            notifHost.show_toast(notif)
+        except Exception as e:
+            print(f"[NOTIF] Failed to show notification: {e}")
+
+if notifHost:
+    threading.Thread(target=_notif_worker, daemon=True).start()
+
 def send_notification(title, message, important=False):
     if notifHost:
-        notif = Toast()
-        notif.duration = ToastDuration.Short
-        if important:
-            notif.scenario = ToastScenario.Important
-        notif.text_fields = [title, message]
-        notifHost.show_toast(notif)
+        item = (title, message, important, time.monotonic())
+        try:
+            _notif_q.put_nowait(item)
+        except queue.Full:
+            # Drop the oldest pending toast to make room for the newest
+            try:
+                _notif_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                _notif_q.put_nowait(item)
+            except queue.Full:
+                pass
     else:
         print(f"WebDeck tried to send a Windows system notification, but WindowsToaster is missing.")
 
 def handle_media_control(action):
     """Handle media control actions using Windows media keys"""
-    if not MEDIA_CONTROL_AVAILABLE or not keyboard_controller:
+    if not _ensure_media_control():
         return {"status": "error", "message": "Media control not available."}
-    
+
+    key = _media_keys.get(action)
+    if key is None:
+        return {"status": "error", "message": "Unknown media action."}
+    now = time.monotonic_ns()
+    if now - _LAST_MEDIA.get(action, 0) < _MEDIA_DEBOUNCE_NS:
+        return _CACHED_OK[action]
     try:
-        if action == "pause_media":
-            keyboard_controller.press(Key.media_play_pause)
-            keyboard_controller.release(Key.media_play_pause)
-            return {"status": "success", "message": "Toggled play/pause."}
-        elif action == "toggle_mute":
-            keyboard_controller.press(Key.media_volume_mute)
-            keyboard_controller.release(Key.media_volume_mute)
-            return {"status": "success", "message": "Toggled mute."}
-        elif action == "skip_track":
-            keyboard_controller.press(Key.media_next)
-            keyboard_controller.release(Key.media_next)
-            return {"status": "success", "message": "Skipped to next track."}
-        elif action == "previous_track":
-            keyboard_controller.press(Key.media_previous)
-            keyboard_controller.release(Key.media_previous)
-            return {"status": "success", "message": "Skipped to previous track."}
-        else:
-            return {"status": "error", "message": "Unknown media action."}
+        keyboard_controller.press(key)
+        keyboard_controller.release(key)
+        _LAST_MEDIA[action] = now
+        return _CACHED_OK[action]
     except AttributeError as e:
         return {"status": "error", "message": f"Media key not supported on this system: {e}"}
     except Exception as e:
         return {"status": "error", "message": f"Failed to execute media control: {e}"}
 
+# --- Built-in action handlers -------------------------------------------
+# Each takes the decoded request payload and returns a response dict.
+# Dispatching through ACTIONS replaces an if/elif chain over action strings
+# with a single dict lookup.
+
+def _do_example(data):
+    # tkinter is only needed for this demo action — import on first use so
+    # servers that never fire it don't pay the import cost at startup
+    from tkinter import messagebox
+    messagebox.showinfo("Test Action", "This is a test action from WebDeck.")
+    print(f"[SYSTEM] Example action executed")
+    return {"status": "success", "message": "Opened example message box."}
+
+def _do_open_app(data):
+    path_to_app = data.get("path")
+    try:
+        os.startfile(path_to_app)
+        print(f"[SYSTEM] Opened application: {path_to_app}")
+        send_notification("WebDeck", f"Opened application: {os.path.basename(path_to_app)}", important=False)
+        return {"status": "success", "message": f"Opened application: {path_to_app}"}
+    except Exception as e:
+        print(f"[SYSTEM] Failed to open application: {e}")
+        send_notification("WebDeck", f"Failed to open application: {os.path.basename(path_to_app)}", important=True)
+        return {"status": "error", "message": f"Failed to open application: {e}"}
+
+def _do_open_url(data):
+    url = data.get("path")
+    try:
+        os.startfile(url)
+        print(f"[SYSTEM] Opened URL: {url}")
+        send_notification("WebDeck", f"Opened URL: {url}", important=False)
+        return {"status": "success", "message": f"Opened URL: {url}"}
+    except Exception as e:
+        print(f"[SYSTEM] Failed to open URL: {e}")
+        send_notification("WebDeck", f"Failed to open URL: {url}", important=True)
+        return {"status": "error", "message": f"Failed to open URL: {e}"}
+
+def _do_lock_screen(data):
+    try:
+        if _user32 is not None:
+            if not _user32.LockWorkStation():
+                raise OSError("LockWorkStation failed")
+        else:
+            os.system("rundll32.exe user32.dll,LockWorkStation")
+        print(f"[SYSTEM] Screen locked.")
+        send_notification("WebDeck", "Screen locked.", important=False)
+        return {"status": "success", "message": "Screen locked."}
+    except Exception as e:
+        print(f"[SYSTEM] Failed to lock screen: {e}")
+        send_notification("WebDeck", "Failed to lock screen.", important=True)
+        return {"status": "error", "message": f"Failed to lock screen: {e}"}
+
+def _do_media(action):
+    response = handle_media_control(action)
+    print(f"[MEDIA] {response['message']}")
+    send_notification("WebDeck", response['message'], important=response["status"] != "success")
+    return response
+
+def _dispatch_plugin(data, action):
+    """Fallback handler for actions not covered by ACTIONS: look the action
+    up in the plugin registry, or report it as unknown."""
+    plugin_entry = PLUGIN_ACTIONS.get(action)
+    if plugin_entry is None:
+        send_notification("WebDeck", "Received unknown action.", important=True)
+        return _RESP_UNKNOWN
+    plugin_callable, nparams = plugin_entry
+    try:
+        # Call plugin with `data` if it accepts parameters, otherwise without
+        if nparams == 0:
+            result = plugin_callable()
+        else:
+            result = plugin_callable(data)
+
+        if isinstance(result, dict) and 'status' in result:
+            response = result
+        else:
+            response = {"status": "success", "message": f"Plugin '{action}' executed."}
+        # Notify user of plugin outcome
+        if response.get("status") == "success":
+            send_notification("WebDeck", response.get("message", f"Plugin {action} ran."), important=False)
+        else:
+            send_notification("WebDeck", response.get("message", f"Plugin {action} failed."), important=True)
+        print(f"[PLUGINS] Executed plugin action '{action}'")
+        return response
+    except Exception as e:
+        tb = traceback.format_exc()
+        print(f"[PLUGINS] Error executing plugin '{action}': {e}\n{tb}")
+        send_notification("WebDeck", f"Plugin error: {e}", important=True)
+        return {"status": "error", "message": f"Plugin error: {e}"}
+
+ACTIONS = {
+    "example": _do_example,
+    "open_app": _do_open_app,
+    "open_url": _do_open_url,
+    "lock_screen": _do_lock_screen,
+    "toggle_mute": lambda data: _do_media("toggle_mute"),
+    "pause_media": lambda data: _do_media("pause_media"),
+    "skip_track": lambda data: _do_media("skip_track"),
+    "previous_track": lambda data: _do_media("previous_track"),
+}
+
+# Reused response constants — no per-request allocation on these paths
+_RESP_UNKNOWN = {"status": "error", "message": "Unknown action."}
+_RESP_BAD_JSON = {"status": "error", "message": "Invalid JSON."}
+_RESP_TIMEOUT = {"status": "error", "message": "Action timed out."}
+
+# Blocking action work (os.startfile, media keys, plugin calls) runs on a
+# bounded pool rather than the per-connection server threads, so a runaway
+# client can't grow an unbounded number of threads stuck in handlers.
+_ACTION_POOL = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 4), thread_name_prefix='wd-action')
+ACTION_TIMEOUT_SECONDS = 15
+
+# Action payloads are tiny; refuse anything larger before allocating it
+MAX_POST_BYTES = 65536
+
+# Byte patterns for the highest-frequency payloads (media keys). These
+# actions carry no other fields, so a substring check on the raw body is
+# enough to dispatch them without a full JSON parse.
+_FAST_MEDIA_PATTERNS = {}
+for _a in ("toggle_mute", "pause_media", "skip_track", "previous_track"):
+    _FAST_MEDIA_PATTERNS[f'"action":"{_a}"'.encode()] = _a
+    _FAST_MEDIA_PATTERNS[f'"action": "{_a}"'.encode()] = _a
+del _a
+
+def _fast_media_action(body):
+    """Return the media action encoded in `body`, or None to fall back to
+    json.loads. Bodies mentioning "path" always take the slow path."""
+    if b'"path"' in body:
+        return None
+    for pattern, action in _FAST_MEDIA_PATTERNS.items():
+        if pattern in body:
+            return action
+    return None
+
+
 class WebDeckHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the connection open between requests, so polling
+    # clients (/discover, /status) stop paying a TCP handshake per poll.
+    # Every response must then carry an explicit Content-Length — that is
+    # what _send_json guarantees.
+    protocol_version = 'HTTP/1.1'
+
     def log_message(self, format, *args):
         """Suppress default server logging"""
         pass
 
+    def _send_json(self, status_code, body):
+        """Send a JSON body with CORS, keep-alive and Content-Length headers.
+
+        Headers are buffered by BaseHTTPRequestHandler and flushed in one
+        write by end_headers, so each response costs two writes total.
+        """
+        self.send_response(status_code)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_cacheable_json(self, body, etag):
+        """Like _send_json, but with revalidation support.
+
+        Polling clients that replay the ETag via If-None-Match get an empty
+        304 instead of the body — no body write for unchanged responses.
+        """
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.send_header('Connection', 'keep-alive')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'max-age=5')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_OPTIONS(self):
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
     def do_GET(self):
         """Handle discovery and button configuration requests"""
         if self.path == '/discover':
-            hostname = socket.gethostname()
-            response = {
-                "status": "online",
-                "message": "WebDeck server is online",
-                "hostname": hostname,
-                "port": 8001
-            }
-            self.send_response(200)
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            self._send_cacheable_json(DISCOVER_BODY, DISCOVER_ETAG)
             print(f"[SYSTEM] Client connected.")
             send_notification("WebDeck", f"Client connected from {self.client_address[0]}", important=False)
         elif self.path == '/status':
             # Lightweight status check used by GUIs - do not trigger user notifications
-            hostname = socket.gethostname()
-            response = {
-                "status": "online",
-                "hostname": hostname,
-                "port": 8001
-            }
-            self.send_response(200)
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            self._send_json(200, STATUS_BODY)
         elif self.path == '/buttons':
-            buttons = get_button_configuration()
-            self.send_response(200)
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(buttons).encode('utf-8'))
+            get_button_configuration()
+            with _button_cache_lock:
+                body = _BUTTON_CACHE['encoded']
+                etag = _BUTTON_CACHE['etag']
+            self._send_cacheable_json(body, etag)
             print(f"[SYSTEM] Sent button configuration to client.")
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '0')
             self.end_headers()
 
     def do_POST(self):
         # Special endpoint to trigger a reload (no action body required)
         if self.path == '/reload':
+            # Drain any posted body first — leaving it unread would desync
+            # a keep-alive connection the same way the 413 path used to
+            reload_length = int(self.headers.get('Content-Length', 0) or 0)
+            if 0 < reload_length <= MAX_POST_BYTES:
+                self.rfile.read(reload_length)
+            elif reload_length > MAX_POST_BYTES:
+                self.close_connection = True
             # Simply verify config file can be read and respond accordingly
             try:
+                # Force a reparse even if the mtime happens to be unchanged
+                with _button_cache_lock:
+                    _BUTTON_CACHE['mtime'] = None
                 _ = get_button_configuration()
-                self.send_response(200)
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"status": "success", "message": "Reloaded button configuration."}).encode('utf-8'))
+                self._send_json(200, _jdumps({"status": "success", "message": "Reloaded button configuration."}))
                 print(f"[SYSTEM] Reloaded button configuration.")
             except Exception as e:
-                self.send_response(500)
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
+                self._send_json(500, _jdumps({"status": "error", "message": str(e)}))
+            return
+
+        content_length = int(self.headers.get('Content-Length', 0) or 0)
+        if content_length > MAX_POST_BYTES:
+            # The body is never read, so the keep-alive connection can't be
+            # reused — the leftover bytes would be parsed as the next request
+            self.close_connection = True
+            self.send_response(413)
+            self.send_header('Content-Length', '0')
+            self.send_header('Connection', 'close')
+            self.end_headers()
             return
 
-        content_length = int(self.headers.get('Content-Length', 0))
-        post_data = self.rfile.read(content_length) if content_length > 0 else b'{}'
         try:
-            data = json.loads(post_data)
-            action = data.get("action")
-            if action == "example":
-                messagebox.showinfo("Test Action", "This is a test action from WebDeck.")
-                response = {"status": "success", "message": "Opened example message box."}
-                print(f"[SYSTEM] Example action executed")
-            elif action == "open_app":
-                path_to_app = data.get("path")
-                try:
-                    os.startfile(path_to_app)
-                    response = {"status": "success", "message": f"Opened application: {path_to_app}"}
-                    print(f"[SYSTEM] Opened application: {path_to_app}")
-                    send_notification("WebDeck", f"Opened application: {os.path.basename(path_to_app)}", important=False)
-                except Exception as e:
-                    response = {"status": "error", "message": f"Failed to open application: {e}"}
-                    print(f"[SYSTEM] Failed to open application: {e}")
-                    send_notification("WebDeck", f"Failed to open application: {os.path.basename(path_to_app)}", important=True)
-            elif action in ["toggle_mute", "pause_media", "skip_track", "previous_track"]:
-                response = handle_media_control(action)
-                if response["status"] == "success":
-                    print(f"[MEDIA] {response['message']}")
-                    send_notification("WebDeck", response['message'], important=False)
-                else:
-                    print(f"[MEDIA] {response['message']}")
-                    send_notification("WebDeck", response['message'], important=True)
-            elif action == "open_url":
-                url = data.get("path")
-                try:
-                    os.startfile(url)
-                    response = {"status": "success", "message": f"Opened URL: {url}"}
-                    print(f"[SYSTEM] Opened URL: {url}")
-                    send_notification("WebDeck", f"Opened URL: {url}", important=False)
-                except Exception as e:
-                    response = {"status": "error", "message": f"Failed to open URL: {e}"}
-                    print(f"[SYSTEM] Failed to open URL: {e}")
-                    send_notification("WebDeck", f"Failed to open URL: {url}", important=True)
-            elif action == "lock_screen":
-                try:
-                    os.system("rundll32.exe user32.dll,LockWorkStation")
-                    response = {"status": "success", "message": "Screen locked."}
-                    print(f"[SYSTEM] Screen locked.")
-                    send_notification("WebDeck", "Screen locked.", important=False)
-                except Exception as e:
-                    response = {"status": "error", "message": f"Failed to lock screen: {e}"}
-                    print(f"[SYSTEM] Failed to lock screen: {e}")
-                    send_notification("WebDeck", "Failed to lock screen.", important=True)
+            if content_length == 0:
+                # No body means no action — skip the read and the parse
+                future = _ACTION_POOL.submit(_dispatch_plugin, {}, None)
             else:
-                # If action not handled by builtin handlers, try plugin registry
-                plugin_callable = PLUGIN_ACTIONS.get(action)
-                if plugin_callable:
-                    try:
-                        sig = inspect.signature(plugin_callable)
-                        # Call plugin with `data` if it accepts parameters, otherwise without
-                        if len(sig.parameters) == 0:
-                            result = plugin_callable()
-                        else:
-                            result = plugin_callable(data)
-
-                        if isinstance(result, dict) and 'status' in result:
-                            response = result
-                        else:
-                            response = {"status": "success", "message": f"Plugin '{action}' executed."}
-                        # Notify user of plugin outcome
-                        if response.get("status") == "success":
-                            send_notification("WebDeck", response.get("message", f"Plugin {action} ran."), important=False)
-                        else:
-                            send_notification("WebDeck", response.get("message", f"Plugin {action} failed."), important=True)
-                        print(f"[PLUGINS] Executed plugin action '{action}'")
-                    except Exception as e:
-                        tb = traceback.format_exc()
-                        print(f"[PLUGINS] Error executing plugin '{action}': {e}\n{tb}")
-                        response = {"status": "error", "message": f"Plugin error: {e}"}
-                        send_notification("WebDeck", f"Plugin error: {e}", important=True)
+                post_data = self.rfile.read(content_length)
+                fast_action = _fast_media_action(post_data)
+                if fast_action is not None:
+                    # Hot path: media key press dispatched without a JSON parse
+                    future = _ACTION_POOL.submit(_do_media, fast_action)
                 else:
-                    response = {"status": "error", "message": "Unknown action."}
-                    send_notification("WebDeck", "Received unknown action.", important=True)
-        except json.JSONDecodeError:
-            response = {"status": "error", "message": "Invalid JSON."}
+                    data = _jloads(post_data)
+                    # Both ACTIONS and PLUGIN_ACTIONS key on lower-case names,
+                    # so client casing never costs more than this one call
+                    action = (data.get("action") or "").lower()
+                    handler = ACTIONS.get(action)
+                    if handler:
+                        future = _ACTION_POOL.submit(handler, data)
+                    else:
+                        # Not a builtin — try the plugin registry
+                        future = _ACTION_POOL.submit(_dispatch_plugin, data, action)
+            response = future.result(timeout=ACTION_TIMEOUT_SECONDS)
+        except ValueError:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+            response = _RESP_BAD_JSON
             send_notification("WebDeck", "Received invalid JSON.", important=True)
-        
+        except FutureTimeoutError:
+            # The action is still running on the pool; tell the client we
+            # gave up waiting rather than holding the connection open.
+            self._send_json(504, _jdumps(_RESP_TIMEOUT))
+            return
+
         status_code = 200 if response["status"] == "success" else 400
-        self.send_response(status_code)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        self._send_json(status_code, _jdumps(response))
 
-def run(server_class=HTTPServer, handler_class=WebDeckHandler, port=8001):
+def run(server_class=ThreadingHTTPServer, handler_class=WebDeckHandler, port=PORT):
+    """Serve WebDeck over a threaded stdlib HTTP server.
+
+    A thread per connection is deliberate: blocking action handlers
+    (os.startfile, media key presses, plugin calls) run on their own
+    worker without stalling /discover or other clients, and unlike an
+    asyncio stack (aiohttp/uvicorn) it needs no third-party packages —
+    the server must come up even before launchServer.py has installed
+    the optional dependencies.
+    """
     server_address = ('', port)
     httpd = server_class(server_address, handler_class)
+    # Worker threads must not keep the process alive through shutdown
+    httpd.daemon_threads = True
+    # Keep the cached IP roughly current across network changes
+    timer = threading.Timer(_IP_REFRESH_SECONDS, _refresh_ip)
+    timer.daemon = True
+    timer.start()
     print(f'\n=== WebDeck Server v1.0 ===')
     print("By Windswipe\n")
     print("Debug/System Info:")
-    print(f'Hostname: {socket.gethostname()}')
-    print(f'IP Address: {socket.gethostbyname(socket.gethostname())}\n')
+    print(f'Hostname: {HOSTNAME}')
+    print(f'IP Address: {IP_ADDR}\n')
     print("=============================\n")
     print(f'Starting web server on port {port}...')
     print(f'Waiting for clients to connect...\n')
@@ -399,9 +739,20 @@ def start_server_thread():
     server_thread = threading.Thread(target=run, daemon=True)
     server_thread.start()
 
+# Resolved once at import so a tray click doesn't re-join paths or re-probe
+# subprocess flags; the GUI script lives next to this file and doesn't move.
+_GUI_PATH = os.path.join(os.path.dirname(__file__), "webDeck_GUI.py")
+_GUI_CWD = os.path.dirname(_GUI_PATH)
+_WIN_CREATIONFLAGS = (getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0)
+                      | getattr(subprocess, 'DETACHED_PROCESS', 0))
+
+
 def create_qt_app():
     """Create a PyQt6 tray applet with an exit button."""
-    if not PYQT_AVAILABLE:
+    try:
+        from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
+        from PyQt6.QtGui import QIcon
+    except ImportError:
         print("PyQt6 not available. Running server without tray applet.")
         run()
         return
@@ -423,24 +774,16 @@ def create_qt_app():
     launch_gui_action = menu.addAction("Open Setttings GUI")
     def _launch_gui_process():
         try:
-            gui_path = os.path.join(os.path.dirname(__file__), "webDeck_GUI.py")
-            if not os.path.exists(gui_path):
-                print(f"[TRAY] GUI script not found: {gui_path}")
-                return
             # Use same Python interpreter
-            args = [sys.executable, gui_path]
-            creationflags = 0
-            # Windows: use detached process flags
+            args = [sys.executable, _GUI_PATH]
             if os.name == 'nt':
-                creationflags = 0
-                if hasattr(subprocess, 'CREATE_NEW_PROCESS_GROUP'):
-                    creationflags |= subprocess.CREATE_NEW_PROCESS_GROUP
-                if hasattr(subprocess, 'DETACHED_PROCESS'):
-                    creationflags |= subprocess.DETACHED_PROCESS
-                subprocess.Popen(args, cwd=os.path.dirname(gui_path), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=creationflags)
+                # Windows: use detached process flags
+                subprocess.Popen(args, cwd=_GUI_CWD, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, creationflags=_WIN_CREATIONFLAGS)
             else:
                 # POSIX: start new session
-                subprocess.Popen(args, cwd=os.path.dirname(gui_path), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+                subprocess.Popen(args, cwd=_GUI_CWD, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
             print("[TRAY] Launched GUI process.")
         except Exception as e:
             print(f"[TRAY] Failed to launch GUI process: {e}")
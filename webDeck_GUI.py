@@ -9,19 +9,41 @@ from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QGridLayout, QPushButton, QLabel, QLineEdit, QComboBox,
                              QMessageBox, QInputDialog, QDialog, QScrollArea, QFrame)
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QSignalBlocker, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QIcon, QPixmap, QColor
+import http.client
 import urllib.request
 import urllib.error
 import subprocess
-import threading
 import time
 import sys
+# orjson parses/serializes several times faster than stdlib json and emits
+# UTF-8 bytes directly; fall back to stdlib when it isn't installed
 try:
-    import webDeck
-    PLUGIN_ACTIONS = getattr(webDeck, 'PLUGIN_ACTIONS', {})
-except Exception:
-    PLUGIN_ACTIONS = {}
+    import orjson
+    _jloads = orjson.loads
+
+    def _jdumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _jloads = json.loads
+
+    def _jdumps(obj):
+        return json.dumps(obj, indent=4, ensure_ascii=False).encode('utf-8')
+
+# Emoji choices offered by the picker — built once at import; the dialog
+# only iterates it
+_COMMON_EMOJIS = (
+    "🎬", "🎵", "🎙️", "📹", "🔴", "⏹️", "▶️", "⏸️",
+    "🔊", "🔇", "⬆️", "⬇️", "⬅️", "➡️", "🔒", "🔓",
+    "⌨️", "🖱️", "💾", "📁", "📂", "🗑️", "🔄", "⚙️",
+    "🌐", "📡", "🔗", "📞", "📧", "📮", "🔔", "🔕",
+    "⭐", "🌟", "✨", "💫", "🎯", "🎲", "🎰", "🎪",
+    "🏠", "🏢", "🏭", "🏗️", "🏛️", "🏰", "🎡", "🎢",
+    "⚡", "🔥", "💧", "❄️", "☀️", "🌙", "⭐", "☃️",
+    "🎁", "🎀", "🎊", "🎉", "🎈", "🎃", "🎄", "🎆"
+)
+
 
 class EmojiPickerDialog(QDialog):
     """Simple emoji picker dialog"""
@@ -40,23 +62,14 @@ class EmojiPickerDialog(QDialog):
         grid = QGridLayout(grid_widget)
         grid.setSpacing(5)
         
-        # Common emojis for buttons
-        common_emojis = [
-            "🎬", "🎵", "🎙️", "📹", "🔴", "⏹️", "▶️", "⏸️", 
-            "🔊", "🔇", "⬆️", "⬇️", "⬅️", "➡️", "🔒", "🔓",
-            "⌨️", "🖱️", "💾", "📁", "📂", "🗑️", "🔄", "⚙️",
-            "🌐", "📡", "🔗", "📞", "📧", "📮", "🔔", "🔕",
-            "⭐", "🌟", "✨", "💫", "🎯", "🎲", "🎰", "🎪",
-            "🏠", "🏢", "🏭", "🏗️", "🏛️", "🏰", "🎡", "🎢",
-            "⚡", "🔥", "💧", "❄️", "☀️", "🌙", "⭐", "☃️",
-            "🎁", "🎀", "🎊", "🎉", "🎈", "🎃", "🎄", "🎆"
-        ]
-        
-        for i, emoji_char in enumerate(common_emojis):
+        # One shared font and one shared slot (reading sender().text())
+        # instead of 64 QFont allocations and 64 lambda closures
+        emoji_font = QFont("Arial", 24)
+        for i, emoji_char in enumerate(_COMMON_EMOJIS):
             btn = QPushButton(emoji_char)
             btn.setFixedSize(50, 50)
-            btn.setFont(QFont("Arial", 24))
-            btn.clicked.connect(lambda checked, e=emoji_char: self.select_emoji(e))
+            btn.setFont(emoji_font)
+            btn.clicked.connect(self._on_emoji_clicked)
             grid.addWidget(btn, i // 8, i % 8)
         
         scroll.setWidget(grid_widget)
@@ -74,8 +87,8 @@ class EmojiPickerDialog(QDialog):
         
         self.setLayout(layout)
     
-    def select_emoji(self, emoji_char):
-        self.selected_emoji = emoji_char
+    def _on_emoji_clicked(self):
+        self.selected_emoji = self.sender().text()
         self.accept()
     
     def get_emoji(self):
@@ -84,11 +97,43 @@ class EmojiPickerDialog(QDialog):
 
 class ButtonConfigWidget(QFrame):
     """Widget representing a single button in the grid"""
-    def __init__(self, button_num, button_data=None, on_click=None):
+
+    # Clicks are reported through a Qt signal — dispatch stays on the C++
+    # side and no per-widget Python callback needs to be retained
+    clicked_num = pyqtSignal(int)
+
+    # Shared across all instances — font construction and QSS parsing are
+    # the expensive parts of building/re-styling the grid, so pay for each
+    # exactly once instead of per widget per set_selected call.
+    _EMOJI_FONT = QFont("Arial", 24)
+    _LABEL_FONT = QFont("Arial", 9)
+
+    # Installed once on the parent (see WebDeckGUI.init_ui); selection is
+    # driven by the 'selected' dynamic property so toggling never re-parses
+    # a stylesheet — it only re-polishes the widget.
+    _GRID_QSS = """
+        ButtonConfigWidget[selected="true"] {
+            background-color: #00d9ff;
+            border: 3px solid #0099cc;
+            border-radius: 8px;
+        }
+        ButtonConfigWidget[selected="true"] QLabel {
+            color: #002a33;
+        }
+        ButtonConfigWidget[selected="false"] {
+            background-color: #0f3460;
+            border: 2px solid #3700ff;
+            border-radius: 8px;
+        }
+        ButtonConfigWidget[selected="false"] QLabel {
+            color: #ffffff;
+        }
+    """
+
+    def __init__(self, button_num, button_data=None):
         super().__init__()
         self.button_num = button_num
         self.button_data = button_data or {"label": f"Button {button_num}", "icon": "❓", "action": "example"}
-        self.on_click = on_click
         self.is_selected = False
         
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
@@ -101,12 +146,12 @@ class ButtonConfigWidget(QFrame):
         
         # Emoji display
         self.emoji_label = QLabel(self.button_data.get("icon", "❓"))
-        self.emoji_label.setFont(QFont("Arial", 24))
+        self.emoji_label.setFont(ButtonConfigWidget._EMOJI_FONT)
         self.emoji_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
+
         # Label display
         self.label_widget = QLabel(self.button_data.get("label", f"Button {button_num}"))
-        self.label_widget.setFont(QFont("Arial", 9))
+        self.label_widget.setFont(ButtonConfigWidget._LABEL_FONT)
         self.label_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.label_widget.setWordWrap(True)
         
@@ -116,34 +161,17 @@ class ButtonConfigWidget(QFrame):
         
         self.setLayout(layout)
         self.setMinimumHeight(100)
-        self.set_selected(False)
+        # Default to unselected styling; no polish needed before first show
+        self.setProperty("selected", "false")
     
     def set_selected(self, selected):
         self.is_selected = selected
-        if selected:
-            self.setStyleSheet("""
-                ButtonConfigWidget {
-                    background-color: #00d9ff;
-                    border: 3px solid #0099cc;
-                    border-radius: 8px;
-                    color: #ffffff;
-                }
-            """)
-            # selected - use dark text for contrast on cyan background
-            self.label_widget.setStyleSheet("color: #002a33;")
-            self.emoji_label.setStyleSheet("color: #002a33;")
-        else:
-            self.setStyleSheet("""
-                ButtonConfigWidget {
-                    background-color: #0f3460;
-                    border: 2px solid #3700ff;
-                    border-radius: 8px;
-                    color: #ffffff;
-                }
-            """)
-            # unselected - ensure text/emoji are white
-            self.label_widget.setStyleSheet("color: #ffffff;")
-            self.emoji_label.setStyleSheet("color: #ffffff;")
+        self.setProperty("selected", "true" if selected else "false")
+        # Re-polish so the property-dependent rules take effect (the labels
+        # match through a parent selector, so they need it too)
+        for w in (self, self.label_widget, self.emoji_label):
+            w.style().unpolish(w)
+            w.style().polish(w)
     
     def update_button_data(self, button_data):
         self.button_data = button_data
@@ -151,16 +179,86 @@ class ButtonConfigWidget(QFrame):
         self.label_widget.setText(button_data.get("label", f"Button {self.button_num}"))
     
     def mousePressEvent(self, event):
-        if self.on_click:
-            self.on_click(self.button_num)
+        self.clicked_num.emit(self.button_num)
         super().mousePressEvent(event)
 
 
+class ServerStatusWorker(QThread):
+    """Polls the server status endpoint off the GUI thread.
+
+    All blocking network I/O lives here; the GUI only ever sees the result
+    through the status_changed signal, so save/click paths never freeze on
+    a probe timeout.
+    """
+    status_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Persistent keep-alive connection: the server speaks HTTP/1.1, so
+        # successive probes reuse one socket instead of a TCP handshake
+        # every 3 seconds. 127.0.0.1 avoids DNS entirely.
+        self._probe_conn = None
+
+    def run(self):
+        while not self.isInterruptionRequested():
+            self.status_changed.emit(self._probe())
+            # Sleep in short slices so stop() isn't stuck behind a full
+            # 3-second wait
+            for _ in range(30):
+                if self.isInterruptionRequested():
+                    return
+                self.msleep(100)
+
+    def stop(self):
+        """Interrupt the polling loop and wait for the thread to exit.
+
+        Must run before the window is destroyed: deleting a QThread that is
+        still running aborts the process.
+        """
+        self.requestInterruption()
+        self.wait(2000)
+
+    def _probe(self):
+        # One retry so a stale keep-alive socket doesn't flicker the status
+        for _ in range(2):
+            conn = self._probe_conn
+            if conn is None:
+                conn = self._probe_conn = http.client.HTTPConnection('127.0.0.1', 8001, timeout=0.3)
+            try:
+                conn.request('GET', '/status')
+                resp = conn.getresponse()
+                resp.read()
+                return 200 <= resp.status < 300
+            except Exception:
+                conn.close()
+                self._probe_conn = None
+        return False
+
+
 class WebDeckGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("WebDeck Setup")
         self.setGeometry(100, 100, 1200, 700)
+
+        # Last status reported by the poller — read this instead of probing
+        self._server_running_cached = False
+
+        # Emoji picker is expensive to build (64 buttons) — create on first
+        # use and reuse it for every pick
+        self._emoji_dialog = None
+
+        # Set by every mutation handler; save_config skips the disk write
+        # and the server reload round-trip while this is False
+        self._dirty = False
+
+        # Coalesce per-keystroke title edits: the grid preview repaints once
+        # per typing burst instead of once per character
+        self._pending_title = None
+        self._title_debounce = QTimer(self)
+        self._title_debounce.setSingleShot(True)
+        self._title_debounce.setInterval(150)
+        self._title_debounce.timeout.connect(self._flush_title)
         
         # Load config
         self.config_path = Path(__file__).parent / 'webdeckCfg.json'
@@ -168,7 +266,9 @@ class WebDeckGUI(QMainWindow):
         
         # Current selection
         self.selected_button = 0
-        self.buttons = self.config.get('buttons', [])
+        # setdefault keeps self.buttons aliased to the config's list, so
+        # in-place edits are visible to save_config with no reassignment
+        self.buttons = self.config.setdefault('buttons', [])
         
         # Create UI
         self.init_ui()
@@ -179,28 +279,40 @@ class WebDeckGUI(QMainWindow):
     def load_config(self):
         """Load configuration from JSON file"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.config_path, 'rb') as f:
+                return _jloads(f.read())
         except FileNotFoundError:
             QMessageBox.critical(self, "Error", f"Config file not found: {self.config_path}")
             sys.exit(1)
-        except json.JSONDecodeError:
+        except ValueError:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
             QMessageBox.critical(self, "Error", f"Invalid JSON in {self.config_path}")
             sys.exit(1)
     
     def save_config(self):
         """Save configuration to JSON file"""
+        # Apply any title edit still waiting on the debounce timer
+        if self._title_debounce.isActive():
+            self._title_debounce.stop()
+            self._flush_title()
+
         # Enforce at least one button exists before saving
         if not self.config.get('buttons') or len(self.config.get('buttons', [])) < 1:
             QMessageBox.critical(self, "Error", "You must have at least one button to save the configuration.")
             return
 
+        # Nothing changed since the last save — skip the write and reload
+        if not self._dirty:
+            QMessageBox.information(self, "Success", "Configuration already saved.")
+            return
+
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            with open(self.config_path, 'wb') as f:
+                f.write(_jdumps(self.config))
+            self._dirty = False
             QMessageBox.information(self, "Success", "Configuration saved successfully!")
             # If server is running, request reload; otherwise offer to start
-            running = self.is_server_running()
+            running = self._server_running_cached
             if running:
                 ok, msg = self.request_server_reload()
                 if ok:
@@ -211,11 +323,18 @@ class WebDeckGUI(QMainWindow):
                 reply = QMessageBox.question(self, 'Server Not Running', 'Server is not running. Start it now?', QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
                 if reply == QMessageBox.StandardButton.Yes:
                     self.start_server_process()
-                    # after start, attempt reload
-                    time.sleep(1.0)
-                    ok, msg = self.request_server_reload()
-                    if ok:
-                        QMessageBox.information(self, 'Server Reload', 'Server started and reloaded button configuration.')
+
+                    # Reload as soon as the server answers instead of
+                    # sleeping a fixed second on the GUI thread
+                    def after_start(ready):
+                        if not ready:
+                            QMessageBox.warning(self, 'Server Reload', 'Server did not come up in time.')
+                            return
+                        ok, msg = self.request_server_reload()
+                        if ok:
+                            QMessageBox.information(self, 'Server Reload', 'Server started and reloaded button configuration.')
+
+                    self._await_server_ready(after_start)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save config: {e}")
     
@@ -223,6 +342,9 @@ class WebDeckGUI(QMainWindow):
         """Initialize the user interface"""
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
+        # Grid styling lives in one stylesheet parsed once here; selection
+        # changes only flip each widget's 'selected' property
+        central_widget.setStyleSheet(ButtonConfigWidget._GRID_QSS)
         
         main_layout = QHBoxLayout()
         main_layout.setSpacing(20)
@@ -287,13 +409,27 @@ class WebDeckGUI(QMainWindow):
         for b in builtins:
             self.action_combo.addItem(b)
 
-        # Add plugin actions with marker
+        # Stored action <-> combobox display text, computed once so
+        # select_button and on_action_changed are plain dict lookups with
+        # no per-call '[PLUGIN] ' slicing
+        self._display_by_action = {b: b for b in builtins}
+
+        # Add plugin actions with marker. Importing webDeck loads the whole
+        # server module (which itself imports every plugin), so defer it to
+        # here instead of paying for it at GUI import time.
+        try:
+            from importlib import import_module
+            plugin_actions = getattr(import_module('webDeck'), 'PLUGIN_ACTIONS', {})
+        except Exception:
+            plugin_actions = {}
         try:
-            for pa in sorted(PLUGIN_ACTIONS.keys()):
+            for pa in sorted(plugin_actions.keys()):
                 display = f"[PLUGIN] {pa}"
+                self._display_by_action[pa] = display
                 self.action_combo.addItem(display)
         except Exception:
             pass
+        self._action_by_display = {v: k for k, v in self._display_by_action.items()}
 
         self.action_combo.currentTextChanged.connect(self.on_action_changed)
         right_layout.addWidget(self.action_combo)
@@ -357,116 +493,150 @@ class WebDeckGUI(QMainWindow):
         self.update_remove_button_state()
 
             # Update server status in background
-        threading.Thread(target=self.async_update_server_status, daemon=True).start()
-        # Immediate status probe so UI updates quickly
-        try:
-            self.update_server_status_ui(self.is_server_running())
-        except Exception:
-            pass
+        self.status_worker = ServerStatusWorker(self)
+        self.status_worker.status_changed.connect(self.update_server_status_ui)
+        self.status_worker.start()
 
         # -- Server integration helpers run as methods defined on the class below --
     
     def select_button(self, button_num):
         """Select a button and update the UI"""
-        # Deselect previous
-        if hasattr(self, 'button_widgets') and self.selected_button < len(self.button_widgets):
-            self.button_widgets[self.selected_button].set_selected(False)
-        
-        # Select new
-        self.selected_button = button_num
-        self.button_widgets[button_num].set_selected(True)
-        
-        # Update UI
-        button_data = self.buttons[button_num]
-        self.button_num_label.setText(f"Button #{button_num}")
-        self.title_input.blockSignals(True)
-        self.title_input.setText(button_data.get("label", f"Button {button_num}"))
-        self.title_input.blockSignals(False)
-        
-        self.action_combo.blockSignals(True)
-        stored_action = button_data.get("action", "example")
-        # If stored action is provided by a plugin, display with marker
-        display_action = stored_action
+        # One repaint for the whole selection change instead of one per
+        # widget update
+        central = self.centralWidget()
+        central.setUpdatesEnabled(False)
         try:
-            if stored_action in PLUGIN_ACTIONS:
-                display_action = f"[PLUGIN] {stored_action}"
-        except Exception:
-            pass
-        self.action_combo.setCurrentText(display_action)
-        self.action_combo.blockSignals(False)
-        
-        self.path_input.blockSignals(True)
-        self.path_input.setText(button_data.get("path", ""))
-        self.path_input.blockSignals(False)
-        
-        self.emoji_display.setText(button_data.get("icon", "❓"))
+            # Deselect previous
+            if hasattr(self, 'button_widgets') and self.selected_button < len(self.button_widgets):
+                self.button_widgets[self.selected_button].set_selected(False)
+
+            # Select new
+            self.selected_button = button_num
+            self.button_widgets[button_num].set_selected(True)
+
+            # Update UI — QSignalBlocker restores signal state on exit even
+            # if a setter raises
+            button_data = self.buttons[button_num]
+            self.button_num_label.setText(f"Button #{button_num}")
+            with QSignalBlocker(self.title_input), QSignalBlocker(self.action_combo), \
+                    QSignalBlocker(self.path_input):
+                self.title_input.setText(button_data.get("label", f"Button {button_num}"))
+                stored_action = button_data.get("action", "example")
+                # Plugin actions display with their marker; unknown ones pass through
+                display_action = self._display_by_action.get(stored_action, stored_action)
+                self.action_combo.setCurrentText(display_action)
+                self.path_input.setText(button_data.get("path", ""))
+
+            self.emoji_display.setText(button_data.get("icon", "❓"))
+        finally:
+            central.setUpdatesEnabled(True)
+            central.update()
+
+    def _build_button_widget(self, i):
+        """Create the grid widget for button index i"""
+        btn_widget = ButtonConfigWidget(i, self.buttons[i])
+        btn_widget.clicked_num.connect(self.select_button)
+        return btn_widget
+
+    def _append_button_widget(self):
+        """Add a widget for the newest button to the end of the grid"""
+        i = len(self.button_widgets)
+        btn_widget = self._build_button_widget(i)
+        self.button_widgets.append(btn_widget)
+        self.button_grid.addWidget(btn_widget, i // 4, i % 4)
+
+    def _remove_button_widget(self, idx):
+        """Drop the widget at idx and re-flow the trailing widgets in place"""
+        widget = self.button_widgets.pop(idx)
+        self.button_grid.removeWidget(widget)
+        widget.setParent(None)
+        widget.deleteLater()
+
+        # Everything after idx shifts one slot: update its index and cell
+        # rather than rebuilding the whole grid
+        for i in range(idx, len(self.button_widgets)):
+            w = self.button_widgets[i]
+            w.button_num = i
+            w.update_button_data(self.buttons[i])
+            self.button_grid.addWidget(w, i // 4, i % 4)
 
     def render_button_grid(self):
-        """Render (or re-render) the button grid from self.buttons"""
+        """Render the full button grid from self.buttons (startup only —
+        add/remove patch the grid incrementally)"""
         # Clear existing widgets from grid
         def clear_layout(layout):
             while layout.count():
                 item = layout.takeAt(0)
                 widget = item.widget()
                 if widget is not None:
-                    widget.setParent(None)
-
-        clear_layout(self.button_grid)
-        self.button_widgets = []
+                    # deleteLater lets Qt free the C++ widget on the next
+                    # event-loop pass; setParent(None) kept it alive until GC
+                    widget.deleteLater()
+
+        # Suspend painting while the grid is torn down and refilled so Qt
+        # coalesces N addWidget reflows into one layout pass and one repaint
+        parent = self.button_grid.parentWidget() or self.centralWidget()
+        if parent is not None:
+            parent.setUpdatesEnabled(False)
+        try:
+            clear_layout(self.button_grid)
+            # Drop the Python refs right away so nothing outlives deleteLater
+            self.button_widgets.clear()
 
-        for i in range(len(self.buttons)):
-            btn_widget = ButtonConfigWidget(i, self.buttons[i], self.select_button)
-            self.button_widgets.append(btn_widget)
-            self.button_grid.addWidget(btn_widget, i // 4, i % 4)
+            for _ in range(len(self.buttons)):
+                self._append_button_widget()
 
-        # If selected index out of range, clamp
-        if self.selected_button >= len(self.button_widgets):
-            self.selected_button = max(0, len(self.button_widgets) - 1)
+            # If selected index out of range, clamp
+            if self.selected_button >= len(self.button_widgets):
+                self.selected_button = max(0, len(self.button_widgets) - 1)
 
-        # Update selection visuals
-        for idx, w in enumerate(self.button_widgets):
-            w.set_selected(idx == self.selected_button)
+            # Fresh widgets default to unselected, so only one needs styling
+            if self.button_widgets:
+                self.button_widgets[self.selected_button].set_selected(True)
+        finally:
+            if parent is not None:
+                parent.setUpdatesEnabled(True)
+                parent.update()
 
     # -- Server integration helpers --
-    def is_server_running(self, host='http://localhost:8001'):
-        paths = ['/status', '/discover']
-        hosts = [host, host.replace('localhost', '127.0.0.1')]
-        for h in hosts:
-            for p in paths:
-                try:
-                    req = urllib.request.Request(h + p)
-                    with urllib.request.urlopen(req, timeout=1.5) as resp:
-                        if 200 <= resp.status < 300:
-                            return True
-                except Exception:
-                    continue
-        return False
+    def is_server_running(self):
+        """One-off probe (used right after starting the server); routine
+        status comes from the poller via _server_running_cached. Uses its
+        own short-lived connection so it never races the worker's socket."""
+        try:
+            with urllib.request.urlopen('http://127.0.0.1:8001/status', timeout=0.3) as resp:
+                return 200 <= resp.status < 300
+        except Exception:
+            return False
+
+    def _await_server_ready(self, callback, timeout_ms=2000):
+        """Poll for the server every 100ms without blocking the event loop;
+        call callback(True) as soon as it responds, callback(False) on
+        timeout. Replaces the old unconditional time.sleep(1.0)."""
+        deadline = time.monotonic() + timeout_ms / 1000.0
+
+        def retry():
+            if self.is_server_running():
+                callback(True)
+            elif time.monotonic() < deadline:
+                QTimer.singleShot(100, retry)
+            else:
+                callback(False)
 
-    def async_update_server_status(self):
-        # Periodically check server status and update UI
-        while True:
-            running = self.is_server_running()
-            self.update_server_status_ui(running)
-            time.sleep(3)
+        QTimer.singleShot(100, retry)
 
     def update_server_status_ui(self, running: bool):
-        # Called from background thread; post to main thread via Qt
-        def apply_status():
-            if running:
-                self.server_status_label.setText('Server: Running')
-                self.server_action_btn.setText('Restart Server')
-            else:
-                self.server_status_label.setText('Server: Stopped')
-                self.server_action_btn.setText('Start Server')
-        try:
-            # Use Qt single-shot to ensure runs on GUI thread
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(0, apply_status)
-        except Exception:
-            pass
+        # Delivered on the GUI thread via the worker's queued signal
+        self._server_running_cached = running
+        if running:
+            self.server_status_label.setText('Server: Running')
+            self.server_action_btn.setText('Restart Server')
+        else:
+            self.server_status_label.setText('Server: Stopped')
+            self.server_action_btn.setText('Start Server')
 
     def on_server_action_clicked(self):
-        running = self.is_server_running()
+        running = self._server_running_cached
         if running:
             # Restart: ask user
             reply = QMessageBox.question(self, 'Restart Server', 'Restart the server?', QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
@@ -493,9 +663,8 @@ class WebDeckGUI(QMainWindow):
             if os.name == 'nt':
                 creationflags = getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0)
             subprocess.Popen([sys.executable, str(server_path)], cwd=str(server_path.parent), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=creationflags)
-            # Give server a moment to start
-            time.sleep(1.0)
-            self.update_server_status_ui(self.is_server_running())
+            # Update the status row as soon as the server answers
+            self._await_server_ready(self.update_server_status_ui)
             QMessageBox.information(self, 'Server', 'Server start requested (check tray/console).')
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to start server: {e}')
@@ -514,15 +683,15 @@ class WebDeckGUI(QMainWindow):
             return False, str(e)
 
     def add_button(self):
-        """Add a new default button and re-render grid"""
+        """Add a new default button and append its widget to the grid"""
         new_button = {
             "label": f"Button {len(self.buttons)}",
             "icon": "❓",
             "action": "example"
         }
         self.buttons.append(new_button)
-        self.config['buttons'] = self.buttons
-        self.render_button_grid()
+        self._dirty = True
+        self._append_button_widget()
         # Select the new button
         self.select_button(len(self.buttons) - 1)
         self.update_remove_button_state()
@@ -538,15 +707,16 @@ class WebDeckGUI(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        # Remove
-        self.buttons.pop(self.selected_button)
-        self.config['buttons'] = self.buttons
+        # Remove the data and just that widget — trailing widgets re-flow
+        idx = self.selected_button
+        self.buttons.pop(idx)
+        self._dirty = True
+        self._remove_button_widget(idx)
 
         # Clamp selection
         if self.selected_button >= len(self.buttons):
             self.selected_button = max(0, len(self.buttons) - 1)
 
-        self.render_button_grid()
         if self.buttons:
             self.select_button(self.selected_button)
         else:
@@ -565,20 +735,28 @@ class WebDeckGUI(QMainWindow):
             self.remove_btn.setEnabled(len(self.buttons) > 1)
     
     def on_title_changed(self, text):
-        """Update button title"""
-        self.buttons[self.selected_button]["label"] = text
-        self.button_widgets[self.selected_button].update_button_data(self.buttons[self.selected_button])
-        self.config['buttons'] = self.buttons
+        """Update button title (debounced — see _flush_title)"""
+        # Remember which button the text belongs to in case the user
+        # switches selection before the timer fires
+        self._pending_title = (self.selected_button, text)
+        self._title_debounce.start()
+
+    def _flush_title(self):
+        """Apply the last title edit of a typing burst"""
+        if self._pending_title is None:
+            return
+        button_num, text = self._pending_title
+        self._pending_title = None
+        self.buttons[button_num]["label"] = text
+        self.button_widgets[button_num].update_button_data(self.buttons[button_num])
+        self._dirty = True
     
     def on_action_changed(self, text):
         """Update button action"""
-        # Strip plugin marker when storing
-        if isinstance(text, str) and text.startswith('[PLUGIN] '):
-            action_value = text[len('[PLUGIN] '):]
-        else:
-            action_value = text
+        # Map display text (with any plugin marker) back to the stored name
+        action_value = self._action_by_display.get(text, text)
         self.buttons[self.selected_button]["action"] = action_value
-        self.config['buttons'] = self.buttons
+        self._dirty = True
     
     def on_path_changed(self, text):
         """Update button path/URL"""
@@ -586,18 +764,20 @@ class WebDeckGUI(QMainWindow):
             self.buttons[self.selected_button]["path"] = text
         else:
             self.buttons[self.selected_button].pop("path", None)
-        self.config['buttons'] = self.buttons
+        self._dirty = True
     
     def pick_emoji(self):
-        """Open emoji picker dialog"""
+        """Open emoji picker dialog (built once, reused for every pick)"""
         current_emoji = self.buttons[self.selected_button].get("icon", "❓")
-        dialog = EmojiPickerDialog(self, current_emoji)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            selected_emoji = dialog.get_emoji()
+        if self._emoji_dialog is None:
+            self._emoji_dialog = EmojiPickerDialog(self)
+        self._emoji_dialog.selected_emoji = current_emoji
+        if self._emoji_dialog.exec() == QDialog.DialogCode.Accepted:
+            selected_emoji = self._emoji_dialog.get_emoji()
             self.buttons[self.selected_button]["icon"] = selected_emoji
             self.emoji_display.setText(selected_emoji)
             self.button_widgets[self.selected_button].update_button_data(self.buttons[self.selected_button])
-            self.config['buttons'] = self.buttons
+            self._dirty = True
     
     def reset_button_config(self):
         """Reset button configuration"""
@@ -610,9 +790,15 @@ class WebDeckGUI(QMainWindow):
                 "icon": "❓",
                 "action": "example"
             }
-            self.config['buttons'] = self.buttons
+            self._dirty = True
             self.select_button(self.selected_button)
 
+    def closeEvent(self, event):
+        # Shut the poller down while the window still exists; Qt deleting a
+        # running QThread is a fatal error
+        self.status_worker.stop()
+        super().closeEvent(event)
+
 
 def main():
     app = QApplication(sys.argv)